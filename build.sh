@@ -25,13 +25,18 @@ fi
 
 mkdir -p "${BUILD_DIR}"
 
-cmake -S . -B "${BUILD_DIR}" \
+# Prefer Ninja for fresh build directories (existing ones keep their generator)
+GENERATOR_ARGS=()
+if [ ! -f "${BUILD_DIR}/CMakeCache.txt" ] && command -v ninja >/dev/null 2>&1; then
+    GENERATOR_ARGS=(-G Ninja)
+fi
+
+cmake -S . -B "${BUILD_DIR}" "${GENERATOR_ARGS[@]}" \
     -DCMAKE_BUILD_TYPE="${BUILD_TYPE}" \
     -DCMAKE_INSTALL_PREFIX="${INSTALL_DIR}"
 
-cmake --build "${BUILD_DIR}" -j$(nproc)
-
-cmake --install "${BUILD_DIR}"
+# Build and install in one cmake invocation
+cmake --build "${BUILD_DIR}" --target install -j$(nproc)
 
 echo ""
 echo "Build complete: ${BUILD_TYPE}"
@@ -0,0 +1,77 @@
+#pragma once
+
+#include <functional>
+#include <memory>
+#include <string>
+#include <utility>
+
+#include "tgfx/handles.hpp"
+
+namespace termin {
+
+class GraphicsBackend;
+
+// Abstract window wrapper (GLFW, SDL, Qt widget, ...).
+// Native backends implement this directly; the instance is bound to Python
+// as-is, so accessors dispatch through the vtable without a handle hop.
+class BackendWindow {
+public:
+    using FramebufferSizeCallback = std::function<void(int width, int height)>;
+    using CursorPosCallback = std::function<void(double x, double y)>;
+    using ScrollCallback = std::function<void(double dx, double dy)>;
+    using MouseButtonCallback = std::function<void(int button, int action, int mods)>;
+    using KeyCallback = std::function<void(int key, int scancode, int action, int mods)>;
+
+    virtual ~BackendWindow() = default;
+
+    // Set graphics backend for framebuffer creation.
+    virtual void set_graphics(GraphicsBackend* graphics) { (void)graphics; }
+
+    // Handle for the default window framebuffer. Owned by the window.
+    virtual FramebufferHandle* get_window_framebuffer() = 0;
+
+    virtual void close() = 0;
+    virtual bool should_close() const = 0;
+    virtual void set_should_close(bool flag) = 0;
+
+    virtual void make_current() = 0;
+    virtual void swap_buffers() = 0;
+
+    virtual std::pair<int, int> framebuffer_size() const = 0;
+    virtual std::pair<int, int> window_size() const = 0;
+    virtual std::pair<double, double> get_cursor_pos() const = 0;
+
+    // --- Event callbacks ---
+    virtual void set_framebuffer_size_callback(FramebufferSizeCallback callback) = 0;
+    virtual void set_cursor_pos_callback(CursorPosCallback callback) = 0;
+    virtual void set_scroll_callback(ScrollCallback callback) = 0;
+    virtual void set_mouse_button_callback(MouseButtonCallback callback) = 0;
+    virtual void set_key_callback(KeyCallback callback) = 0;
+
+    // True if the backend drives rendering itself (e.g. Qt widget),
+    // false if the engine calls render() each frame (e.g. GLFW).
+    virtual bool drives_render() const { return false; }
+
+    virtual void request_update() = 0;
+};
+
+using BackendWindowPtr = std::shared_ptr<BackendWindow>;
+
+// Abstract window backend (GLFW, SDL, etc.).
+class WindowBackend {
+public:
+    virtual ~WindowBackend() = default;
+
+    // share: window whose GL context is shared with the new one, or nullptr.
+    virtual BackendWindowPtr create_window(
+        int width,
+        int height,
+        const std::string& title,
+        BackendWindow* share = nullptr
+    ) = 0;
+
+    virtual void poll_events() = 0;
+    virtual void terminate() = 0;
+};
+
+} // namespace termin
@@ -16,7 +16,13 @@ BUILD_DIR="build/${BUILD_TYPE}"
 
 mkdir -p "${BUILD_DIR}"
 
-cmake -S . -B "${BUILD_DIR}" \
+# Prefer Ninja for fresh build directories (existing ones keep their generator)
+GENERATOR_ARGS=()
+if [ ! -f "${BUILD_DIR}/CMakeCache.txt" ] && command -v ninja >/dev/null 2>&1; then
+    GENERATOR_ARGS=(-G Ninja)
+fi
+
+cmake -S . -B "${BUILD_DIR}" "${GENERATOR_ARGS[@]}" \
     -DCMAKE_BUILD_TYPE="${BUILD_TYPE}" \
     -DCMAKE_INSTALL_PREFIX="${PREFIX}"
 
@@ -24,17 +30,20 @@ cmake --build "${BUILD_DIR}" -j$(nproc)
 
 sudo cmake --install "${BUILD_DIR}"
 
+# Hardlink a library into a directory (symlinks are recreated as symlinks).
+# Falls back to a copy when source and destination are on different filesystems.
+place() {
+    local src="$1" dst="$2/$(basename "$1")"
+    if [ ! -L "$src" ] && sudo ln -f "$src" "$dst" 2>/dev/null; then
+        return
+    fi
+    sudo cp -a "$src" "$dst"
+}
+
 sudo mkdir -p /opt/termin/lib
 shopt -s nullglob
 for lib in "${PREFIX}"/lib*/libtermin_graphics.so* "${PREFIX}"/lib/*/libtermin_graphics.so*; do
-    sudo cp -a "$lib" /opt/termin/lib/
-done
-shopt -u nullglob
-
-# Also copy from build dir (Debug/Release) if present
-shopt -s nullglob
-for lib in "${BUILD_DIR}"/libtermin_graphics.so* "${BUILD_DIR}"/lib/libtermin_graphics.so*; do
-    sudo cp -a "$lib" /opt/termin/lib/
+    place "$lib" /opt/termin/lib
 done
 shopt -u nullglob
 
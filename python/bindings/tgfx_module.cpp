@@ -11,6 +11,7 @@ namespace tgfx_bindings {
     void bind_shader(nb::module_& m);
     void bind_texture(nb::module_& m);
     void bind_mesh(nb::module_& m);
+    void bind_window(nb::module_& m);
 }
 
 NB_MODULE(_tgfx_native, m) {
@@ -23,6 +24,7 @@ NB_MODULE(_tgfx_native, m) {
     tgfx_bindings::bind_shader(m);
     tgfx_bindings::bind_texture(m);
     tgfx_bindings::bind_mesh(m);
+    tgfx_bindings::bind_window(m);
 
     // Import log from tcbase
     nb::module_ tcbase = nb::module_::import_("tcbase._tcbase_native");
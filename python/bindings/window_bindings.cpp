@@ -0,0 +1,222 @@
+// window_bindings.cpp - BackendWindow, WindowBackend
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/pair.h>
+#include <nanobind/stl/shared_ptr.h>
+#include <nanobind/stl/optional.h>
+#include <nanobind/stl/function.h>
+#include <nanobind/trampoline.h>
+
+#include "tgfx/graphics_backend.hpp"
+#include "tgfx/window_backend.hpp"
+
+#include <array>
+#include <cstddef>
+#include <functional>
+#include <memory>
+#include <optional>
+#include <unordered_map>
+
+namespace nb = nanobind;
+
+using namespace termin;
+
+namespace tgfx_bindings {
+
+namespace {
+
+// Event slots of a BackendWindow that can hold a Python callback.
+enum CallbackSlot {
+    FramebufferSizeSlot,
+    CursorPosSlot,
+    ScrollSlot,
+    MouseButtonSlot,
+    KeySlot,
+    CallbackSlotCount
+};
+
+// Live Python callbacks per native window. The Python references are owned
+// by the PyCallback inside the window's std::function; the table only lets
+// BackendWindow's tp_traverse report them, so Python's GC can collect cycles
+// like owner -> window -> callback (bound method) -> owner. Guarded by the GIL.
+using CallbackTable = std::unordered_map<const BackendWindow*, std::array<const nb::callable*, CallbackSlotCount>>;
+
+CallbackTable& callback_table() {
+    static CallbackTable table;
+    return table;
+}
+
+void forget_callback(const BackendWindow* window, CallbackSlot slot, const nb::callable* fn) {
+    auto& table = callback_table();
+    auto it = table.find(window);
+    if (it == table.end() || it->second[slot] != fn) return;
+    it->second[slot] = nullptr;
+    for (const nb::callable* other : it->second) {
+        if (other) return;
+    }
+    table.erase(it);
+}
+
+// Python callable stored by move, invoked from the native event loop.
+// The GIL is taken only around the call; copies of the enclosing
+// std::function share one reference instead of bumping the Python refcount.
+template <typename... Args>
+class PyCallback {
+public:
+    PyCallback(const BackendWindow* window, CallbackSlot slot, nb::callable fn)
+        : fn_(new nb::callable(std::move(fn)), [window, slot](nb::callable* p) {
+              nb::gil_scoped_acquire gil;
+              forget_callback(window, slot, p);
+              delete p;
+          }) {
+        callback_table()[window][slot] = fn_.get();
+    }
+
+    void operator()(Args... args) const {
+        nb::gil_scoped_acquire gil;
+        try {
+            (*fn_)(args...);
+        } catch (nb::python_error& e) {
+            // Don't unwind through the windowing system
+            e.discard_as_unraisable("BackendWindow callback");
+        }
+    }
+
+private:
+    std::shared_ptr<nb::callable> fn_;
+};
+
+// None clears the callback.
+template <typename... Args>
+std::function<void(Args...)> wrap_callback(const BackendWindow& window, CallbackSlot slot, std::optional<nb::callable> callback) {
+    if (!callback) return {};
+    return PyCallback<Args...>(&window, slot, std::move(*callback));
+}
+
+int backend_window_tp_traverse(PyObject* self, visitproc visit, void* arg) {
+#if PY_VERSION_HEX >= 0x03090000
+    Py_VISIT(Py_TYPE(self));
+#endif
+    if (!nb::inst_ready(self)) return 0;
+    auto it = callback_table().find(nb::inst_ptr<BackendWindow>(self));
+    if (it == callback_table().end()) return 0;
+    for (const nb::callable* fn : it->second) {
+        if (fn) Py_VISIT(fn->ptr());
+    }
+    return 0;
+}
+
+// Drops the window's Python callbacks; their deleters remove the table entry.
+int backend_window_tp_clear(PyObject* self) {
+    if (!nb::inst_ready(self)) return 0;
+    BackendWindow* window = nb::inst_ptr<BackendWindow>(self);
+    auto it = callback_table().find(window);
+    if (it == callback_table().end()) return 0;
+    auto slots = it->second;
+    try {
+        if (slots[FramebufferSizeSlot]) window->set_framebuffer_size_callback({});
+        if (slots[CursorPosSlot]) window->set_cursor_pos_callback({});
+        if (slots[ScrollSlot]) window->set_scroll_callback({});
+        if (slots[MouseButtonSlot]) window->set_mouse_button_callback({});
+        if (slots[KeySlot]) window->set_key_callback({});
+    } catch (nb::python_error& e) {
+        e.discard_as_unraisable("BackendWindow tp_clear");
+    }
+    return 0;
+}
+
+PyType_Slot backend_window_slots[] = {
+    { Py_tp_traverse, (void*) backend_window_tp_traverse },
+    { Py_tp_clear, (void*) backend_window_tp_clear },
+    { 0, nullptr }
+};
+
+// Trampolines: Python subclasses override the virtuals, C++ callers go
+// through the vtable and only cross into Python for overridden methods.
+class PyBackendWindow : public BackendWindow {
+public:
+    NB_TRAMPOLINE(BackendWindow, 17);
+
+    void set_graphics(GraphicsBackend* graphics) override { NB_OVERRIDE(set_graphics, graphics); }
+    FramebufferHandle* get_window_framebuffer() override { NB_OVERRIDE_PURE(get_window_framebuffer); }
+    void close() override { NB_OVERRIDE_PURE(close); }
+    bool should_close() const override { NB_OVERRIDE_PURE(should_close); }
+    void set_should_close(bool flag) override { NB_OVERRIDE_PURE(set_should_close, flag); }
+    void make_current() override { NB_OVERRIDE_PURE(make_current); }
+    void swap_buffers() override { NB_OVERRIDE_PURE(swap_buffers); }
+    std::pair<int, int> framebuffer_size() const override { NB_OVERRIDE_PURE(framebuffer_size); }
+    std::pair<int, int> window_size() const override { NB_OVERRIDE_PURE(window_size); }
+    std::pair<double, double> get_cursor_pos() const override { NB_OVERRIDE_PURE(get_cursor_pos); }
+    void set_framebuffer_size_callback(FramebufferSizeCallback callback) override { NB_OVERRIDE_PURE(set_framebuffer_size_callback, callback); }
+    void set_cursor_pos_callback(CursorPosCallback callback) override { NB_OVERRIDE_PURE(set_cursor_pos_callback, callback); }
+    void set_scroll_callback(ScrollCallback callback) override { NB_OVERRIDE_PURE(set_scroll_callback, callback); }
+    void set_mouse_button_callback(MouseButtonCallback callback) override { NB_OVERRIDE_PURE(set_mouse_button_callback, callback); }
+    void set_key_callback(KeyCallback callback) override { NB_OVERRIDE_PURE(set_key_callback, callback); }
+    bool drives_render() const override { NB_OVERRIDE(drives_render); }
+    void request_update() override { NB_OVERRIDE_PURE(request_update); }
+};
+
+class PyWindowBackend : public WindowBackend {
+public:
+    NB_TRAMPOLINE(WindowBackend, 3);
+
+    BackendWindowPtr create_window(int width, int height, const std::string& title, BackendWindow* share) override {
+        NB_OVERRIDE_PURE(create_window, width, height, title, share);
+    }
+    void poll_events() override { NB_OVERRIDE_PURE(poll_events); }
+    void terminate() override { NB_OVERRIDE_PURE(terminate); }
+};
+
+} // namespace
+
+void bind_window(nb::module_& m) {
+    // BackendWindow - bound directly, methods dispatch straight to the vtable.
+    // Subclassable from Python (subclasses must call super().__init__()).
+    nb::class_<BackendWindow, PyBackendWindow>(m, "BackendWindow", nb::type_slots(backend_window_slots))
+        .def(nb::init<>())
+        .def("set_graphics", &BackendWindow::set_graphics, nb::arg("graphics").none())
+        .def("get_window_framebuffer", &BackendWindow::get_window_framebuffer, nb::rv_policy::reference_internal)
+        .def("close", &BackendWindow::close)
+        .def("should_close", &BackendWindow::should_close)
+        .def("set_should_close", &BackendWindow::set_should_close, nb::arg("flag"))
+        // Blocking calls into the windowing system / driver: release the GIL
+        .def("make_current", &BackendWindow::make_current, nb::call_guard<nb::gil_scoped_release>())
+        .def("swap_buffers", &BackendWindow::swap_buffers, nb::call_guard<nb::gil_scoped_release>())
+        .def("framebuffer_size", &BackendWindow::framebuffer_size)
+        .def("window_size", &BackendWindow::window_size)
+        .def("get_cursor_pos", &BackendWindow::get_cursor_pos)
+        .def("set_framebuffer_size_callback", [](BackendWindow& self, std::optional<nb::callable> callback) {
+            self.set_framebuffer_size_callback(wrap_callback<int, int>(self, FramebufferSizeSlot, std::move(callback)));
+        }, nb::arg("callback").none())
+        .def("set_cursor_pos_callback", [](BackendWindow& self, std::optional<nb::callable> callback) {
+            self.set_cursor_pos_callback(wrap_callback<double, double>(self, CursorPosSlot, std::move(callback)));
+        }, nb::arg("callback").none())
+        .def("set_scroll_callback", [](BackendWindow& self, std::optional<nb::callable> callback) {
+            self.set_scroll_callback(wrap_callback<double, double>(self, ScrollSlot, std::move(callback)));
+        }, nb::arg("callback").none())
+        .def("set_mouse_button_callback", [](BackendWindow& self, std::optional<nb::callable> callback) {
+            self.set_mouse_button_callback(wrap_callback<int, int, int>(self, MouseButtonSlot, std::move(callback)));
+        }, nb::arg("callback").none())
+        .def("set_key_callback", [](BackendWindow& self, std::optional<nb::callable> callback) {
+            self.set_key_callback(wrap_callback<int, int, int, int>(self, KeySlot, std::move(callback)));
+        }, nb::arg("callback").none())
+        .def("drives_render", &BackendWindow::drives_render)
+        .def("request_update", &BackendWindow::request_update);
+
+    // WindowBackend
+    nb::class_<WindowBackend, PyWindowBackend>(m, "WindowBackend")
+        .def(nb::init<>())
+        // Two typed overloads instead of an optional share object
+        .def("create_window", [](WindowBackend& self, int width, int height, const std::string& title, std::nullptr_t) {
+            return self.create_window(width, height, title, nullptr);
+        }, nb::arg("width"), nb::arg("height"), nb::arg("title"), nb::arg("share") = nullptr,
+           nb::sig("def create_window(self, width: int, height: int, title: str, share: None = None) -> tgfx._tgfx_native.BackendWindow"))
+        .def("create_window", [](WindowBackend& self, int width, int height, const std::string& title, BackendWindow& share) {
+            return self.create_window(width, height, title, &share);
+        }, nb::arg("width"), nb::arg("height"), nb::arg("title"), nb::arg("share"))
+        // Event callbacks re-acquire the GIL (see PyCallback)
+        .def("poll_events", &WindowBackend::poll_events, nb::call_guard<nb::gil_scoped_release>())
+        .def("terminate", &WindowBackend::terminate);
+}
+
+} // namespace tgfx_bindings
@@ -12,6 +12,108 @@ if _sys.platform == "win32":
     except ImportError:
         pass
 
-from tgfx._tgfx_native import *
-from tgfx._tgfx_native import log
+from tgfx._tgfx_native import (
+    # Render types
+    Color4,
+    Size2i,
+    Rect2i,
+    PolygonMode,
+    BlendFactor,
+    DepthFunc,
+    RenderState,
+    DrawMode,
+    # GPU handles
+    ShaderHandle,
+    GPUMeshHandle,
+    GPUTextureHandle,
+    FramebufferHandle,
+    # Graphics backend
+    GraphicsBackend,
+    OpenGLGraphicsBackend,
+    init_opengl,
+    # Shaders
+    TcShaderHandle,
+    ShaderVariantOp,
+    ShaderFeature,
+    TcShader,
+    shader_count,
+    shader_get_all_info,
+    # Textures
+    TcTexture,
+    TextureData,
+    tc_texture_count,
+    tc_texture_get_all_info,
+    # Meshes
+    Mesh3,
+    TcAttribType,
+    TcDrawMode,
+    TcVertexLayout,
+    TcMeshData,
+    TcMesh,
+    TcMeshHandle,
+    tc_mesh_compute_uuid,
+    tc_mesh_get,
+    tc_mesh_get_or_create,
+    tc_mesh_set_data,
+    tc_mesh_contains,
+    tc_mesh_count,
+    tc_mesh_get_all_info,
+    tc_mesh_declare,
+    tc_mesh_is_loaded,
+    tc_mesh_ensure_loaded,
+    tc_mesh_set_load_callback,
+    tc_mesh_clear_load_callback,
+    # Logging (from tcbase)
+    log,
+)
 from tgfx.window import BackendWindow, WindowBackend
+
+__all__ = [
+    "Color4",
+    "Size2i",
+    "Rect2i",
+    "PolygonMode",
+    "BlendFactor",
+    "DepthFunc",
+    "RenderState",
+    "DrawMode",
+    "ShaderHandle",
+    "GPUMeshHandle",
+    "GPUTextureHandle",
+    "FramebufferHandle",
+    "GraphicsBackend",
+    "OpenGLGraphicsBackend",
+    "init_opengl",
+    "TcShaderHandle",
+    "ShaderVariantOp",
+    "ShaderFeature",
+    "TcShader",
+    "shader_count",
+    "shader_get_all_info",
+    "TcTexture",
+    "TextureData",
+    "tc_texture_count",
+    "tc_texture_get_all_info",
+    "Mesh3",
+    "TcAttribType",
+    "TcDrawMode",
+    "TcVertexLayout",
+    "TcMeshData",
+    "TcMesh",
+    "TcMeshHandle",
+    "tc_mesh_compute_uuid",
+    "tc_mesh_get",
+    "tc_mesh_get_or_create",
+    "tc_mesh_set_data",
+    "tc_mesh_contains",
+    "tc_mesh_count",
+    "tc_mesh_get_all_info",
+    "tc_mesh_declare",
+    "tc_mesh_is_loaded",
+    "tc_mesh_ensure_loaded",
+    "tc_mesh_set_load_callback",
+    "tc_mesh_clear_load_callback",
+    "log",
+    "BackendWindow",
+    "WindowBackend",
+]
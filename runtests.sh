@@ -3,7 +3,13 @@ set -e
 
 BUILD_DIR="build/Release"
 
-cmake -S . -B "${BUILD_DIR}" \
+# Prefer Ninja for fresh build directories (existing ones keep their generator)
+GENERATOR_ARGS=()
+if [ ! -f "${BUILD_DIR}/CMakeCache.txt" ] && command -v ninja >/dev/null 2>&1; then
+    GENERATOR_ARGS=(-G Ninja)
+fi
+
+cmake -S . -B "${BUILD_DIR}" "${GENERATOR_ARGS[@]}" \
     -DCMAKE_BUILD_TYPE=Release \
     -DBUILD_TESTS=ON \
     -DCMAKE_INSTALL_PREFIX=install